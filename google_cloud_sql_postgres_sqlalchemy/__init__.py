@@ -6,10 +6,13 @@ PostgreSQL databases, both locally and on Google Cloud SQL.
 
 from .cloud_sql_proxy import (
     cloud_sql_proxy_running,
+    cloud_sql_proxy_running_async,
     get_cloud_sql_proxy_path,
     is_valid_cloud_sql_instance_name,
 )
 from .create_engine import (
+    close_connector,
+    create_async_postgres_engine_in_cloud_sql,
     create_database_engine,
     create_postgres_engine,
     create_postgres_engine_in_cloud_sql,
@@ -19,7 +22,10 @@ from .create_engine import (
 __version__ = "1.0.0"
 
 __all__ = [
+    "close_connector",
     "cloud_sql_proxy_running",
+    "cloud_sql_proxy_running_async",
+    "create_async_postgres_engine_in_cloud_sql",
     "create_database_engine",
     "create_postgres_engine",
     "create_postgres_engine_in_cloud_sql",
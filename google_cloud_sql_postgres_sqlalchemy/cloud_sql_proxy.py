@@ -1,17 +1,57 @@
 """Utilities for working with Cloud SQL Proxy."""
 
+import asyncio
 import logging
 import os
-import platform
 import re
 import shutil
+import socket
 import subprocess
+import sys
+import threading
 import time
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import IO
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the proxy to exit after SIGTERM before killing it
+_PROXY_SHUTDOWN_TIMEOUT = 5
+
+# Pattern: project-id:region:instance-name
+# Project IDs: 6-30 chars, start with letter, letters/numbers/hyphens
+# Region: GCP region format (e.g., us-central1, northamerica-northeast1)
+# Instance name: letters, numbers, hyphens
+# Used with fullmatch so a trailing newline is rejected, and with an explicit
+# [0-9] so non-ASCII digits are rejected in the region
+_INSTANCE_CONNECTION_RE = re.compile(
+    r"[a-z][a-z0-9-]{5,29}:[a-z]+(?:-[a-z]+)*[0-9]+:[a-z0-9-]+",
+)
+
+# Default cloud-sql-proxy install locations, keyed by ``sys.platform``
+_PLATFORM_CANDIDATE_PATHS: dict[str, tuple[str, ...]] = {
+    "darwin": (
+        "/opt/homebrew/bin/cloud-sql-proxy",  # Apple Silicon
+        "/usr/local/bin/cloud-sql-proxy",  # Intel Mac
+    ),
+    "linux": (
+        "/usr/local/bin/cloud-sql-proxy",
+        "/usr/bin/cloud-sql-proxy",
+    ),
+    "win32": (
+        (
+            "C:\\Program Files\\Google\\Cloud SDK\\"
+            "google-cloud-sdk\\bin\\cloud-sql-proxy.exe"
+        ),
+        "cloud-sql-proxy.exe",
+    ),
+}
+
+# Resolved once at import time; the platform cannot change within a process
+_CANDIDATE_PATHS = _PLATFORM_CANDIDATE_PATHS.get(sys.platform, ())
+
 
 def is_valid_cloud_sql_instance_name(instance_connection_name: str) -> bool:
     """
@@ -31,57 +71,106 @@ def is_valid_cloud_sql_instance_name(instance_connection_name: str) -> bool:
         >>> is_valid_cloud_sql_instance_name("invalid-format")
         False
     """
-    # Pattern: project-id:region:instance-name
-    # Project IDs: 6-30 chars, start with letter, letters/numbers/hyphens
-    # Region: GCP region format (e.g., us-central1, northamerica-northeast1)
-    # Instance name: letters, numbers, hyphens
-    pattern = r"^[a-z][a-z0-9-]{5,29}:[a-z]+(-[a-z]+)*\d+:[a-z0-9-]+$"
-    return bool(re.match(pattern, instance_connection_name))
+    return _INSTANCE_CONNECTION_RE.fullmatch(instance_connection_name) is not None
 
 
+@lru_cache(maxsize=1)
 def get_cloud_sql_proxy_path() -> str:
     """
     Automatically detects the cloud-sql-proxy path based on the operating system.
 
     Returns the path to cloud-sql-proxy executable.
+
+    The result is cached for the lifetime of the process. Call
+    ``get_cloud_sql_proxy_path.cache_clear()`` to pick up changes to ``PATH``
+    or newly installed binaries.
     """
     # First, try to find it in PATH
     proxy_path = shutil.which("cloud-sql-proxy")
     if proxy_path:
         return proxy_path
 
-    # Platform-specific default paths
-    system = platform.system()
-
-    if system == "Darwin":  # macOS
-        # Try common Homebrew paths
-        possible_paths = [
-            "/opt/homebrew/bin/cloud-sql-proxy",  # Apple Silicon
-            "/usr/local/bin/cloud-sql-proxy",  # Intel Mac
-        ]
-    elif system == "Linux":
-        possible_paths = [
-            "/usr/local/bin/cloud-sql-proxy",
-            "/usr/bin/cloud-sql-proxy",
-        ]
-    elif system == "Windows":
-        possible_paths = [
-            (
-                "C:\\Program Files\\Google\\Cloud SDK\\"
-                "google-cloud-sdk\\bin\\cloud-sql-proxy.exe"
-            ),
-            "cloud-sql-proxy.exe",
-        ]
-    else:
-        possible_paths = []
-
-    # Check if any of the default paths exist
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
-
-    # Fallback to just the command name (will fail if not in PATH)
-    return "cloud-sql-proxy"
+    # Check if any of the platform-specific default paths exist. A stat per
+    # candidate is cheaper than listing directories such as /usr/bin, no two
+    # candidates share a directory, and the probe stops at the first hit.
+    return next(
+        (path for path in _CANDIDATE_PATHS if os.path.exists(path)),
+        # Fallback to just the command name (will fail if not in PATH)
+        "cloud-sql-proxy",
+    )
+
+
+def _proxy_command(
+    instance_connection_name: str,
+    port: int,
+    cloud_sql_proxy_path: str | None,
+) -> list[str]:
+    """Resolve the proxy binary, log the startup details, and build its argv."""
+    if cloud_sql_proxy_path is None:
+        cloud_sql_proxy_path = get_cloud_sql_proxy_path()
+
+    logger.info("Starting Cloud SQL Proxy...")
+    logger.info("Using cloud-sql-proxy at: %s", cloud_sql_proxy_path)
+    logger.info("Connecting to instance: %s on port %s", instance_connection_name, port)
+
+    return [
+        cloud_sql_proxy_path,
+        f"{instance_connection_name}",
+        "--port",
+        f"{port}",
+    ]
+
+
+def _log_proxy_output(stream: IO[bytes]) -> None:
+    """Forward each line of the proxy's output to the logger at DEBUG level."""
+    with stream:
+        for line in iter(stream.readline, b""):
+            logger.debug(
+                "cloud-sql-proxy: %s",
+                line.decode(errors="replace").rstrip(),
+            )
+
+
+def _wait_for_proxy_ready(
+    process: subprocess.Popen[bytes],
+    port: int,
+    timeout: float,
+) -> None:
+    """
+    Block until the proxy accepts TCP connections on the local port.
+
+    Polls ``127.0.0.1:port`` with exponential backoff (50ms doubling up to
+    500ms) instead of sleeping for a fixed amount of time.
+
+    Args:
+        process: The running cloud-sql-proxy process
+        port: Local port the proxy binds to
+        timeout: Maximum number of seconds to wait
+
+    Raises:
+        RuntimeError: If the proxy exits before it becomes ready
+        TimeoutError: If the proxy is not ready within ``timeout`` seconds
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        if process.poll() is not None:
+            raise RuntimeError(
+                f"cloud-sql-proxy exited with code {process.returncode} "
+                "before it was ready",
+            )
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"cloud-sql-proxy was not ready on port {port} "
+                f"within {timeout} seconds",
+            )
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
 
 
 @contextmanager
@@ -90,6 +179,7 @@ def cloud_sql_proxy_running(
     instance_connection_name: str,
     port: int,
     cloud_sql_proxy_path: str | None = None,
+    readiness_timeout: float = 10.0,
 ) -> Generator[None]:
     """
     Context manager to run cloud-sql-proxy.
@@ -99,25 +189,144 @@ def cloud_sql_proxy_running(
         port: Local port to bind the proxy to
         cloud_sql_proxy_path: Optional explicit path to cloud-sql-proxy.
                               If None, will auto-detect based on OS.
-    """
-    if cloud_sql_proxy_path is None:
-        cloud_sql_proxy_path = get_cloud_sql_proxy_path()
-
-    logger.info("Starting Cloud SQL Proxy...")
-    logger.info("Using cloud-sql-proxy at: %s", cloud_sql_proxy_path)
-    logger.info("Connecting to instance: %s on port %s", instance_connection_name, port)
+        readiness_timeout: Maximum seconds to wait for the proxy to accept
+                           connections on ``port`` (default: 10.0)
 
+    Raises:
+        RuntimeError: If the proxy exits before it becomes ready
+        TimeoutError: If the proxy is not ready within ``readiness_timeout``
+    """
     process = subprocess.Popen(
-        [
-            cloud_sql_proxy_path,
-            f"{instance_connection_name}",
-            "--port",
-            f"{port}",
-        ],
+        _proxy_command(instance_connection_name, port, cloud_sql_proxy_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        close_fds=True,
+        # Own session so a Ctrl-C in the parent does not kill the proxy
+        # before it is shut down cleanly below
+        start_new_session=True,
     )
-    time.sleep(5)  # wait for proxy to start
+    if process.stdout is not None:
+        threading.Thread(
+            target=_log_proxy_output,
+            args=(process.stdout,),
+            name="cloud-sql-proxy-output",
+            daemon=True,
+        ).start()
     try:
+        _wait_for_proxy_ready(process, port, readiness_timeout)
         yield
     finally:
         process.terminate()
-        process.wait()
+        try:
+            process.wait(timeout=_PROXY_SHUTDOWN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning("cloud-sql-proxy did not exit after SIGTERM, killing it")
+            process.kill()
+            process.wait()
+
+
+async def _log_proxy_output_async(stream: asyncio.StreamReader) -> None:
+    """Forward each line of the proxy's output to the logger at DEBUG level."""
+    async for line in stream:
+        logger.debug("cloud-sql-proxy: %s", line.decode(errors="replace").rstrip())
+
+
+async def _wait_for_proxy_ready_async(
+    process: asyncio.subprocess.Process,
+    port: int,
+    timeout: float,
+) -> None:
+    """
+    Wait, without blocking the event loop, until the proxy accepts connections.
+
+    Async counterpart of ``_wait_for_proxy_ready`` with the same backoff.
+
+    Args:
+        process: The running cloud-sql-proxy process
+        port: Local port the proxy binds to
+        timeout: Maximum number of seconds to wait
+
+    Raises:
+        RuntimeError: If the proxy exits before it becomes ready
+        TimeoutError: If the proxy is not ready within ``timeout`` seconds
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", port),
+                timeout=0.2,
+            )
+        except (OSError, asyncio.TimeoutError):
+            pass
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+        if process.returncode is not None:
+            raise RuntimeError(
+                f"cloud-sql-proxy exited with code {process.returncode} "
+                "before it was ready",
+            )
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"cloud-sql-proxy was not ready on port {port} "
+                f"within {timeout} seconds",
+            )
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
+
+
+@asynccontextmanager
+async def cloud_sql_proxy_running_async(
+    *,
+    instance_connection_name: str,
+    port: int,
+    cloud_sql_proxy_path: str | None = None,
+    readiness_timeout: float = 10.0,
+) -> AsyncGenerator[None]:
+    """
+    Async context manager to run cloud-sql-proxy.
+
+    Same as ``cloud_sql_proxy_running`` but starts, probes, and stops the
+    proxy without blocking the event loop.
+
+    Args:
+        instance_connection_name: GCP Cloud SQL instance connection name
+        port: Local port to bind the proxy to
+        cloud_sql_proxy_path: Optional explicit path to cloud-sql-proxy.
+                              If None, will auto-detect based on OS.
+        readiness_timeout: Maximum seconds to wait for the proxy to accept
+                           connections on ``port`` (default: 10.0)
+
+    Raises:
+        RuntimeError: If the proxy exits before it becomes ready
+        TimeoutError: If the proxy is not ready within ``readiness_timeout``
+    """
+    process = await asyncio.create_subprocess_exec(
+        *_proxy_command(instance_connection_name, port, cloud_sql_proxy_path),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+    )
+    output_task = (
+        asyncio.create_task(_log_proxy_output_async(process.stdout))
+        if process.stdout is not None
+        else None
+    )
+    try:
+        await _wait_for_proxy_ready_async(process, port, readiness_timeout)
+        yield
+    finally:
+        if process.returncode is None:
+            process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=_PROXY_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("cloud-sql-proxy did not exit after SIGTERM, killing it")
+            process.kill()
+            await process.wait()
+        if output_task is not None:
+            output_task.cancel()
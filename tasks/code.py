@@ -1,12 +1,23 @@
 """Reusable code quality tasks for Python projects."""
 
+import json
+import shutil
+import sys
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import quote
 
 from invoke.collection import Collection
 from invoke.context import Context
 from invoke.tasks import task
 
+# Keep colored output without allocating a pseudo-terminal (pty=True) per run
+_COLOR_ENV = {"FORCE_COLOR": "1"}
+
+# JSON coverage reports written by coverage_score, one per coverage path
+_COVERAGE_REPORTS = Path(".coverage_reports")
+
 
 def _complexity_threshold_to_grade(threshold: int) -> str:
     """Convert numeric complexity threshold to radon grade for violations.
@@ -43,7 +54,7 @@ def autoformat(c: Context, path: str = ".") -> None:
     _run_black(c, path=path)
     _run_format(c, path=path)
     cmd = f"ruff check {path} --fix"
-    c.run(cmd, pty=True)
+    c.run(cmd, env=_COLOR_ENV)
 
 
 @task(help={"path": "Path to folder to run ruff check on."})
@@ -53,8 +64,8 @@ def check(c: Context, path: str = ".") -> None:
     Fails (non-zero exit) if any issues are present.
     """
     # Ruff check only (no --fix), it will return non-zero if issues exist
-    format_result = c.run(f"ruff format --diff {path}", pty=True)
-    lint_result = c.run(f"ruff check {path}", pty=True)
+    format_result = c.run(f"ruff format --diff {path}", env=_COLOR_ENV)
+    lint_result = c.run(f"ruff check {path}", env=_COLOR_ENV)
     if (format_result and format_result.exited != 0) or (
         lint_result and lint_result.exited != 0
     ):
@@ -67,16 +78,24 @@ def check(c: Context, path: str = ".") -> None:
         print("✅ Code is properly formatted and linted.")
 
 
+def _mypy_command(path: str) -> str:
+    return f"mypy {path}"
+
+
+def _ty_command(path: str) -> str:
+    return f"ty check {path}"
+
+
 @task(help={"path": "Path to tests or test folder."})
 def mypy(c: Context, path: str = ".") -> None:
     """Run mypy type checking."""
-    c.run(f"mypy {path}", pty=True)
+    c.run(_mypy_command(path), env=_COLOR_ENV)
 
 
 @task(help={"path": "Path to tests or test folder."})
 def ty(c: Context, path: str = ".") -> None:
     """Run ty type checking (faster alternative to mypy)."""
-    c.run(f"ty check {path}", pty=True)
+    c.run(_ty_command(path), env=_COLOR_ENV)
 
 
 @task(help={"path": "Path to tests or test folder."})
@@ -141,40 +160,98 @@ def coverage_xml(
     c.run(f"pytest --cov={path} --cov-report=xml", pty=True)
 
 
+def _newest_mtime(*paths: Path) -> float:
+    """Return the newest modification time of the Python files under paths."""
+    return max(
+        (file.stat().st_mtime for path in paths for file in path.rglob("*.py")),
+        default=0.0,
+    )
+
+
 @task(help={})
 def coverage_score(
     c: Context,
     path: str = "google_cloud_sql_postgres_sqlalchemy",
     env: str = "TEST",
 ) -> None:
-    """Get single coverage score as percentage."""
-    cmd = (
-        f"export ENVIRONMENT={env};"
-        f"pytest --cov={path} -q 2>&1 | grep 'TOTAL' | awk '{{print $NF}}'"
-    )
-    result = c.run(cmd, pty=False, hide=True)
-    if result and result.stdout:
-        score = result.stdout.strip()
-        print(f"Coverage: {score}")
-    else:
+    """
+    Get single coverage score as percentage.
+
+    Reads the total from a JSON coverage report kept per coverage path. The
+    test suite is only run when that report is missing or older than the
+    source or test files. If the tests fail, the report is discarded and no
+    score is printed.
+    """
+    # One report per coverage path, so a report for another path is never reused
+    report = _COVERAGE_REPORTS / f"{quote(path, safe='')}.json"
+    if not report.exists() or report.stat().st_mtime < _newest_mtime(
+        Path(path),
+        Path("tests"),
+    ):
+        report.parent.mkdir(exist_ok=True)
+        result = c.run(
+            f"pytest --cov={path} --cov-report=json:{report} -q",
+            env={"ENVIRONMENT": env},
+            warn=True,
+            hide=True,
+        )
+        if result is None or result.exited != 0:
+            report.unlink(missing_ok=True)
+            print(
+                "❌ Tests failed, so there is no coverage score. "
+                "Run `invoke code.test` to see the failures.",
+            )
+            exit(1)
+    try:
+        totals = json.loads(report.read_text())["totals"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         print("Could not determine coverage score")
+        return
+    print(f"Coverage: {totals['percent_covered']:.2f}%")
 
 
-@task(help={"path": "Path to tests or test folder."})
-def ci(c: Context, path: str = ".", env: str = "TEST") -> None:
+@task(
+    help={
+        "path": "Path to tests or test folder.",
+        "parallel": "Run ty and mypy concurrently (default: True)",
+    },
+)
+def ci(c: Context, path: str = ".", env: str = "TEST", parallel: bool = True) -> None:
     """
     Run Continuous Integration tasks.
 
     Includes: autoformat, check, ty, mypy, security, complexity, test.
+
+    autoformat and check run first because they modify or gate the source.
+    ty and mypy only read it, so they run concurrently unless
+    ``--no-parallel`` is given; their output is captured and printed one
+    check at a time as each finishes. test, security and complexity stream
+    their output through a terminal, so they run afterwards, one at a time.
     """
     autoformat(c, path=path)
     check(c, path=path)
-    ty(c, path=path)
-    mypy(c, path=path)
+    if parallel:
+        commands = [_ty_command(path), _mypy_command(path)]
+        failed = False
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            futures = [
+                executor.submit(c.run, command, env=_COLOR_ENV, hide=True, warn=True)
+                for command in commands
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                print(result.stdout, end="")
+                print(result.stderr, end="", file=sys.stderr)
+                failed = failed or result.exited != 0
+        if failed:
+            exit(1)
+    else:
+        ty(c, path=path)
+        mypy(c, path=path)
+    test(c, path=path, env=env)
     # Security and complexity use their own default paths (server)
     security(c)
     complexity(c)
-    test(c, path=path, env=env)
 
 
 @task(help={})
@@ -544,8 +621,6 @@ def licenses(
         )
 
         if license_check and license_check.stdout:
-            import json
-
             licenses_data = json.loads(license_check.stdout)
             found_problematic = []
 
@@ -634,15 +709,26 @@ def duplication(
 
 @task(help={})
 def clean(c: Context) -> None:
-    """Remove cached folders."""
-    c.run("rm -rf .mypy_cache", pty=True)
-    c.run("rm -rf .pytest_cache", pty=True)
-    c.run("rm -rf .ruff_cache", pty=True)
-    c.run('find . -type d -name "__pycache__" -exec rm -rf {} +', pty=True)
-    c.run("rm -rf htmlcov")
-    c.run("rm -rf .mypy-coverage")
-    c.run("rm -rf *.egg-info")
-    c.run("rm -rf site")
+    """Remove cached folders and build artifacts."""
+    root = Path()
+    folders = [
+        root / name
+        for name in (
+            ".mypy_cache",
+            ".pytest_cache",
+            ".ruff_cache",
+            "htmlcov",
+            _COVERAGE_REPORTS.name,
+            ".mypy-coverage",
+            "site",
+            "build",
+            "dist",
+        )
+    ]
+    folders += root.glob("*.egg-info")
+    folders += root.rglob("__pycache__")
+    for folder in folders:
+        shutil.rmtree(folder, ignore_errors=True)
 
 
 @task(help={})
@@ -1,63 +1,131 @@
 """Tests for the cloud_sql_proxy module."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import io
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import time
+from collections.abc import Callable, Generator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, call
 
 import pytest
 
 from google_cloud_sql_postgres_sqlalchemy import (
+    cloud_sql_proxy,
     cloud_sql_proxy_running,
+    cloud_sql_proxy_running_async,
     get_cloud_sql_proxy_path,
     is_valid_cloud_sql_instance_name,
 )
+from google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy import (
+    _PLATFORM_CANDIDATE_PATHS,
+    _log_proxy_output,
+    _wait_for_proxy_ready,
+    _wait_for_proxy_ready_async,
+)
+
+
+def _unused_port() -> int:
+    """Return a local port with nothing listening on it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+def _exists_only(*paths: str) -> Callable[[object], bool]:
+    """Return an os.path.exists stand-in that is true only for ``paths``."""
+    return frozenset(paths).__contains__
+
+
+class _ProcStub:
+    """Lightweight stand-in for ``subprocess.Popen`` that records lifecycle calls.
+
+    ``wait_results`` is consumed one item per ``wait()`` call; exceptions in it
+    are raised instead of returned.
+    """
+
+    def __init__(self, *, returncode: int | None = None) -> None:
+        self.stdout = io.BytesIO()
+        self.returncode = returncode
+        self.terminate_calls = 0
+        self.kill_calls = 0
+        self.wait_timeouts: list[float | None] = []
+        self.wait_results: list[int | BaseException] = []
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminate_calls += 1
+
+    def kill(self) -> None:
+        self.kill_calls += 1
+
+    def wait(self, timeout: float | None = None) -> int:
+        self.wait_timeouts.append(timeout)
+        result = self.wait_results.pop(0) if self.wait_results else 0
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+@pytest.fixture(autouse=True)
+def clear_proxy_path_cache() -> Generator[None]:
+    """Reset the cached proxy path so each test sees its own patches."""
+    get_cloud_sql_proxy_path.cache_clear()
+    yield
+    get_cloud_sql_proxy_path.cache_clear()
+
+
+VALID_INSTANCE_NAMES = (
+    "my-project:us-central1:my-instance",
+    "test-project:europe-west1:db-instance",
+    "prod123:asia-east1:database-1",
+    "project-a:us-west2:instance-b",
+    "myapp01:northamerica-northeast1:postgres-db",
+)
+
+INVALID_INSTANCE_NAMES = (
+    "invalid",  # Missing colons
+    "project:region",  # Missing instance name
+    "project:us-central1",  # Missing instance name
+    ":us-central1:instance",  # Missing project
+    "project::instance",  # Missing region
+    "Project:us-central1:instance",  # Uppercase in project
+    "project:US-CENTRAL1:instance",  # Uppercase in region
+    "project:us-central1:Instance",  # Uppercase in instance
+    "123project:us-central1:instance",  # Project starts with number
+    "pr:us-central1:instance",  # Project too short (< 6 chars)
+    "a" * 31 + ":us-central1:instance",  # Project too long (> 30 chars)
+    "project:invalid-region:instance",  # Invalid region format
+    "project:us-central:instance",  # Missing number in region
+    "project:us-1:instance",  # Invalid region format
+)
 
 
 class TestIsValidCloudSqlInstanceName:
     """Tests for is_valid_cloud_sql_instance_name function."""
 
-    def test_valid_instance_names(self) -> None:
+    @pytest.mark.parametrize("name", VALID_INSTANCE_NAMES)
+    def test_valid_instance_names(self, name: str) -> None:
         """Test valid Cloud SQL instance connection names."""
-        # Given valid instance connection names
-        valid_names = [
-            "my-project:us-central1:my-instance",
-            "test-project:europe-west1:db-instance",
-            "prod123:asia-east1:database-1",
-            "project-a:us-west2:instance-b",
-            "myapp01:northamerica-northeast1:postgres-db",
-        ]
+        # Given a valid instance connection name
+        # When I validate it
+        # Then it should be valid
+        assert is_valid_cloud_sql_instance_name(name)
 
-        # When I validate each name
-        # Then all should be valid
-        for name in valid_names:
-            assert is_valid_cloud_sql_instance_name(name), (
-                f"Expected {name} to be valid"
-            )
-
-    def test_invalid_instance_names(self) -> None:
+    @pytest.mark.parametrize("name", INVALID_INSTANCE_NAMES)
+    def test_invalid_instance_names(self, name: str) -> None:
         """Test invalid Cloud SQL instance connection names."""
-        # Given invalid instance connection names
-        invalid_names = [
-            "invalid",  # Missing colons
-            "project:region",  # Missing instance name
-            "project:us-central1",  # Missing instance name
-            ":us-central1:instance",  # Missing project
-            "project::instance",  # Missing region
-            "Project:us-central1:instance",  # Uppercase in project
-            "project:US-CENTRAL1:instance",  # Uppercase in region
-            "project:us-central1:Instance",  # Uppercase in instance
-            "123project:us-central1:instance",  # Project starts with number
-            "pr:us-central1:instance",  # Project too short (< 6 chars)
-            "a" * 31 + ":us-central1:instance",  # Project too long (> 30 chars)
-            "project:invalid-region:instance",  # Invalid region format
-            "project:us-central:instance",  # Missing number in region
-            "project:us-1:instance",  # Invalid region format
-        ]
-
-        # When I validate each name
-        # Then all should be invalid
-        for name in invalid_names:
-            assert not is_valid_cloud_sql_instance_name(
-                name,
-            ), f"Expected {name} to be invalid"
+        # Given an invalid instance connection name
+        # When I validate it
+        # Then it should be invalid
+        assert not is_valid_cloud_sql_instance_name(name)
 
     def test_edge_cases(self) -> None:
         """Test edge cases for instance name validation."""
@@ -79,40 +147,68 @@ class TestIsValidCloudSqlInstanceName:
         # Only colons
         assert not is_valid_cloud_sql_instance_name("::")
 
+        # Trailing newline
+        assert not is_valid_cloud_sql_instance_name("project:us-central1:db\n")
+
+        # Non-ASCII digits in region
+        assert not is_valid_cloud_sql_instance_name("project:us-central\u0661:db")
+
+
+@pytest.fixture
+def path_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch PATH and filesystem lookups for get_cloud_sql_proxy_path."""
+    which = Mock(return_value=None)
+    exists = Mock(return_value=False)
+    monkeypatch.setattr(shutil, "which", which)
+    monkeypatch.setattr(os.path, "exists", exists)
+
+    def use_candidates(paths: tuple[str, ...]) -> None:
+        monkeypatch.setattr(cloud_sql_proxy, "_CANDIDATE_PATHS", paths)
+
+    return SimpleNamespace(which=which, exists=exists, use_candidates=use_candidates)
+
 
 class TestGetCloudSqlProxyPath:
     """Tests for get_cloud_sql_proxy_path function."""
 
-    @patch("shutil.which")
-    def test_found_in_path(self, mock_which: Mock) -> None:
+    def test_found_in_path(self, path_mocks: SimpleNamespace) -> None:
         """Test when cloud-sql-proxy is found in PATH."""
         # Given cloud-sql-proxy is in PATH
         expected_path = "/usr/bin/cloud-sql-proxy"
-        mock_which.return_value = expected_path
+        path_mocks.which.return_value = expected_path
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
 
         # Then it should return the PATH location
         assert result == expected_path
-        mock_which.assert_called_once_with("cloud-sql-proxy")
+        path_mocks.which.assert_called_once_with("cloud-sql-proxy")
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_macos_apple_silicon(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_result_is_cached(self, path_mocks: SimpleNamespace) -> None:
+        """Test that repeated lookups reuse the cached result."""
+        # Given cloud-sql-proxy is in PATH
+        path_mocks.which.return_value = "/usr/bin/cloud-sql-proxy"
+
+        # When I get the proxy path twice
+        first = get_cloud_sql_proxy_path()
+        second = get_cloud_sql_proxy_path()
+
+        # Then PATH should only be searched once
+        assert first == second == "/usr/bin/cloud-sql-proxy"
+        path_mocks.which.assert_called_once_with("cloud-sql-proxy")
+
+        # And clearing the cache should trigger a fresh lookup
+        get_cloud_sql_proxy_path.cache_clear()
+        path_mocks.which.return_value = "/opt/bin/cloud-sql-proxy"
+        assert get_cloud_sql_proxy_path() == "/opt/bin/cloud-sql-proxy"
+
+    def test_macos_apple_silicon(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on macOS Apple Silicon."""
         # Given macOS system and proxy not in PATH
-        mock_which.return_value = None
-        mock_system.return_value = "Darwin"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["darwin"])
         # Apple Silicon path exists
-        mock_exists.side_effect = (
-            lambda path: path == "/opt/homebrew/bin/cloud-sql-proxy"
+        path_mocks.exists.side_effect = _exists_only(
+            "/opt/homebrew/bin/cloud-sql-proxy",
         )
 
         # When I get the proxy path
@@ -121,21 +217,12 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the Apple Silicon Homebrew path
         assert result == "/opt/homebrew/bin/cloud-sql-proxy"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_macos_intel(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_macos_intel(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on macOS Intel."""
         # Given macOS system and proxy not in PATH
-        mock_which.return_value = None
-        mock_system.return_value = "Darwin"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["darwin"])
         # Intel Mac path exists (Apple Silicon path doesn't)
-        mock_exists.side_effect = lambda path: path == "/usr/local/bin/cloud-sql-proxy"
+        path_mocks.exists.side_effect = _exists_only("/usr/local/bin/cloud-sql-proxy")
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -143,21 +230,12 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the Intel Mac path
         assert result == "/usr/local/bin/cloud-sql-proxy"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_linux(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_linux(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on Linux."""
         # Given Linux system and proxy not in PATH
-        mock_which.return_value = None
-        mock_system.return_value = "Linux"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["linux"])
         # First Linux path exists
-        mock_exists.side_effect = lambda path: path == "/usr/local/bin/cloud-sql-proxy"
+        path_mocks.exists.side_effect = _exists_only("/usr/local/bin/cloud-sql-proxy")
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -165,21 +243,12 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the Linux path
         assert result == "/usr/local/bin/cloud-sql-proxy"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_linux_alternative_path(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_linux_alternative_path(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on Linux with alternative path."""
         # Given Linux system and proxy not in PATH
-        mock_which.return_value = None
-        mock_system.return_value = "Linux"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["linux"])
         # Second Linux path exists
-        mock_exists.side_effect = lambda path: path == "/usr/bin/cloud-sql-proxy"
+        path_mocks.exists.side_effect = _exists_only("/usr/bin/cloud-sql-proxy")
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -187,25 +256,16 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the alternative Linux path
         assert result == "/usr/bin/cloud-sql-proxy"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_windows(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_windows(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on Windows."""
         # Given Windows system and proxy not in PATH
-        mock_which.return_value = None
-        mock_system.return_value = "Windows"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["win32"])
         # Windows Cloud SDK path exists
         expected_path = (
             "C:\\Program Files\\Google\\Cloud SDK\\"
             "google-cloud-sdk\\bin\\cloud-sql-proxy.exe"
         )
-        mock_exists.side_effect = lambda path: path == expected_path
+        path_mocks.exists.side_effect = _exists_only(expected_path)
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -213,21 +273,12 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the Windows Cloud SDK path
         assert result == expected_path
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_windows_current_directory(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_windows_current_directory(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on Windows in current directory."""
         # Given Windows system and proxy not in PATH or Cloud SDK
-        mock_which.return_value = None
-        mock_system.return_value = "Windows"
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["win32"])
         # Current directory path exists
-        mock_exists.side_effect = lambda path: path == "cloud-sql-proxy.exe"
+        path_mocks.exists.side_effect = _exists_only("cloud-sql-proxy.exe")
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -235,20 +286,10 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the current directory exe
         assert result == "cloud-sql-proxy.exe"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_fallback_to_command_name(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_fallback_to_command_name(self, path_mocks: SimpleNamespace) -> None:
         """Test fallback when proxy is not found anywhere."""
         # Given no proxy found anywhere
-        mock_which.return_value = None
-        mock_system.return_value = "Linux"
-        mock_exists.return_value = False
+        path_mocks.use_candidates(_PLATFORM_CANDIDATE_PATHS["linux"])
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -256,20 +297,10 @@ class TestGetCloudSqlProxyPath:
         # Then it should return the command name as fallback
         assert result == "cloud-sql-proxy"
 
-    @patch("platform.system")
-    @patch("os.path.exists")
-    @patch("shutil.which")
-    def test_unknown_platform(
-        self,
-        mock_which: Mock,
-        mock_exists: Mock,
-        mock_system: Mock,
-    ) -> None:
+    def test_unknown_platform(self, path_mocks: SimpleNamespace) -> None:
         """Test proxy detection on unknown platform."""
         # Given unknown platform
-        mock_which.return_value = None
-        mock_system.return_value = "UnknownOS"
-        mock_exists.return_value = False
+        path_mocks.use_candidates(())
 
         # When I get the proxy path
         result = get_cloud_sql_proxy_path()
@@ -278,58 +309,62 @@ class TestGetCloudSqlProxyPath:
         assert result == "cloud-sql-proxy"
 
 
+@pytest.fixture
+def proxy_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch process startup and readiness for cloud_sql_proxy_running."""
+    process = _ProcStub()
+    popen = Mock(return_value=process)
+    wait_for_ready = Mock()
+    get_path = Mock(return_value="/usr/bin/cloud-sql-proxy")
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(cloud_sql_proxy, "_wait_for_proxy_ready", wait_for_ready)
+    monkeypatch.setattr(cloud_sql_proxy, "get_cloud_sql_proxy_path", get_path)
+    return SimpleNamespace(
+        popen=popen,
+        process=process,
+        wait_for_ready=wait_for_ready,
+        get_path=get_path,
+    )
+
+
 class TestCloudSqlProxyRunning:
     """Tests for cloud_sql_proxy_running context manager."""
 
-    @patch("subprocess.Popen")
-    @patch("time.sleep")
-    @patch(
-        "google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy.get_cloud_sql_proxy_path",
-    )
-    def test_starts_and_stops_proxy(
-        self,
-        mock_get_path: Mock,
-        mock_sleep: Mock,
-        mock_popen: Mock,
-    ) -> None:
+    def test_starts_and_stops_proxy(self, proxy_mocks: SimpleNamespace) -> None:
         """Test that proxy starts and stops correctly."""
         # Given a proxy path and mock process
-        mock_get_path.return_value = "/usr/bin/cloud-sql-proxy"
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
-
         # When I use the context manager
         with cloud_sql_proxy_running(
             instance_connection_name="project:region:instance",
             port=5432,
         ):
             # Then the proxy should be started
-            mock_popen.assert_called_once_with(
+            proxy_mocks.popen.assert_called_once_with(
                 [
                     "/usr/bin/cloud-sql-proxy",
                     "project:region:instance",
                     "--port",
                     "5432",
                 ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                close_fds=True,
+                start_new_session=True,
+            )
+            proxy_mocks.wait_for_ready.assert_called_once_with(
+                proxy_mocks.process,
+                5432,
+                10.0,
             )
-            mock_sleep.assert_called_once_with(5)
 
         # And the proxy should be terminated when exiting context
-        mock_process.terminate.assert_called_once()
-        mock_process.wait.assert_called_once()
+        assert proxy_mocks.process.terminate_calls == 1
+        assert proxy_mocks.process.wait_timeouts == [5]
 
-    @patch("subprocess.Popen")
-    @patch("time.sleep")
-    def test_uses_custom_proxy_path(
-        self,
-        mock_sleep: Mock,
-        mock_popen: Mock,
-    ) -> None:
+    def test_uses_custom_proxy_path(self, proxy_mocks: SimpleNamespace) -> None:
         """Test using a custom proxy path."""
         # Given a custom proxy path
         custom_path = "/custom/path/cloud-sql-proxy"
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
 
         # When I use the context manager with custom path
         with cloud_sql_proxy_running(
@@ -338,36 +373,27 @@ class TestCloudSqlProxyRunning:
             cloud_sql_proxy_path=custom_path,
         ):
             # Then it should use the custom path
-            mock_popen.assert_called_once_with(
+            proxy_mocks.popen.assert_called_once_with(
                 [
                     custom_path,
                     "project:region:instance",
                     "--port",
                     "5433",
                 ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                close_fds=True,
+                start_new_session=True,
             )
+            proxy_mocks.get_path.assert_not_called()
 
         # And cleanup should still happen
-        mock_process.terminate.assert_called_once()
-        mock_process.wait.assert_called_once()
+        assert proxy_mocks.process.terminate_calls == 1
+        assert proxy_mocks.process.wait_timeouts == [5]
 
-    @patch("subprocess.Popen")
-    @patch("time.sleep")
-    @patch(
-        "google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy.get_cloud_sql_proxy_path",
-    )
-    def test_cleanup_on_exception(
-        self,
-        mock_get_path: Mock,
-        mock_sleep: Mock,
-        mock_popen: Mock,
-    ) -> None:
+    def test_cleanup_on_exception(self, proxy_mocks: SimpleNamespace) -> None:
         """Test that proxy is cleaned up even when exception occurs."""
         # Given a proxy that starts successfully
-        mock_get_path.return_value = "/usr/bin/cloud-sql-proxy"
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
-
         # When an exception occurs inside the context
         with (
             pytest.raises(ValueError),
@@ -379,28 +405,19 @@ class TestCloudSqlProxyRunning:
             raise ValueError("Test exception")
 
         # Then the proxy should still be terminated
-        mock_process.terminate.assert_called_once()
-        mock_process.wait.assert_called_once()
+        assert proxy_mocks.process.terminate_calls == 1
+        assert proxy_mocks.process.wait_timeouts == [5]
 
-    @patch("subprocess.Popen")
-    @patch("time.sleep")
-    @patch(
-        "google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy.get_cloud_sql_proxy_path",
-    )
-    @patch("google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy.logger")
     def test_logs_startup_messages(
         self,
-        mock_logger: Mock,
-        mock_get_path: Mock,
-        mock_sleep: Mock,
-        mock_popen: Mock,
+        proxy_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that startup messages are logged."""
-        # Given a proxy path
+        # Given a proxy path and a mock logger
         proxy_path = "/usr/bin/cloud-sql-proxy"
-        mock_get_path.return_value = proxy_path
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
+        mock_logger = Mock()
+        monkeypatch.setattr(cloud_sql_proxy, "logger", mock_logger)
 
         # When I use the context manager
         with cloud_sql_proxy_running(
@@ -410,11 +427,306 @@ class TestCloudSqlProxyRunning:
             pass
 
         # Then startup messages should be logged
-        assert mock_logger.info.call_count == 3
-        mock_logger.info.assert_any_call("Starting Cloud SQL Proxy...")
-        mock_logger.info.assert_any_call("Using cloud-sql-proxy at: %s", proxy_path)
-        mock_logger.info.assert_any_call(
-            "Connecting to instance: %s on port %s",
-            "my-project:us-central1:my-instance",
+        assert mock_logger.info.call_args_list == [
+            call("Starting Cloud SQL Proxy..."),
+            call("Using cloud-sql-proxy at: %s", proxy_path),
+            call(
+                "Connecting to instance: %s on port %s",
+                "my-project:us-central1:my-instance",
+                5432,
+            ),
+        ]
+
+    def test_cleanup_when_proxy_not_ready(self, proxy_mocks: SimpleNamespace) -> None:
+        """Test that proxy is cleaned up when it never becomes ready."""
+        # Given a proxy that never becomes ready
+        proxy_mocks.wait_for_ready.side_effect = TimeoutError("not ready")
+
+        # When I enter the context manager
+        # Then the readiness error should propagate
+        with (
+            pytest.raises(TimeoutError),
+            cloud_sql_proxy_running(
+                instance_connection_name="project:region:instance",
+                port=5432,
+                readiness_timeout=1.5,
+            ),
+        ):
+            pass  # pragma: no cover
+
+        # And the proxy should still be terminated
+        proxy_mocks.wait_for_ready.assert_called_once_with(
+            proxy_mocks.process,
             5432,
+            1.5,
+        )
+        assert proxy_mocks.process.terminate_calls == 1
+        assert proxy_mocks.process.wait_timeouts == [5]
+
+    def test_kills_proxy_that_ignores_sigterm(
+        self,
+        proxy_mocks: SimpleNamespace,
+    ) -> None:
+        """Test that a proxy which does not exit after SIGTERM is killed."""
+        # Given a proxy that does not exit within the shutdown timeout
+        proxy_mocks.process.wait_results = [
+            subprocess.TimeoutExpired("cloud-sql-proxy", 5),
+            0,
+        ]
+
+        # When I exit the context manager
+        with cloud_sql_proxy_running(
+            instance_connection_name="project:region:instance",
+            port=5432,
+        ):
+            pass
+
+        # Then the proxy should be terminated, then killed
+        assert proxy_mocks.process.terminate_calls == 1
+        assert proxy_mocks.process.kill_calls == 1
+        assert proxy_mocks.process.wait_timeouts == [5, None]
+
+
+class TestLogProxyOutput:
+    """Tests for _log_proxy_output function."""
+
+    def test_forwards_lines_to_logger(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that proxy output lines are logged at DEBUG level."""
+        # Given proxy output with two lines
+        stream = io.BytesIO(b"Authorizing with ADC\nready for new connections\n")
+
+        # When I forward the output
+        with caplog.at_level(
+            logging.DEBUG,
+            logger="google_cloud_sql_postgres_sqlalchemy.cloud_sql_proxy",
+        ):
+            _log_proxy_output(stream)
+
+        # Then each line should be logged without its trailing newline
+        assert [r.getMessage() for r in caplog.records] == [
+            "cloud-sql-proxy: Authorizing with ADC",
+            "cloud-sql-proxy: ready for new connections",
+        ]
+        # And the stream should be closed
+        assert stream.closed
+
+
+@pytest.fixture
+def socket_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch the probe socket and backoff sleep for _wait_for_proxy_ready."""
+    socket_class = MagicMock()
+    sleep = Mock()
+    monkeypatch.setattr(socket, "socket", socket_class)
+    monkeypatch.setattr(time, "sleep", sleep)
+    return SimpleNamespace(
+        sock=socket_class.return_value.__enter__.return_value,
+        sleep=sleep,
+    )
+
+
+class TestWaitForProxyReady:
+    """Tests for _wait_for_proxy_ready function."""
+
+    def test_returns_when_port_accepts_connections(
+        self,
+        socket_mocks: SimpleNamespace,
+    ) -> None:
+        """Test that it returns as soon as the port accepts connections."""
+        # Given a port that accepts connections on the second attempt
+        mock_sock = socket_mocks.sock
+        mock_sleep = socket_mocks.sleep
+        mock_sock.connect_ex.side_effect = [111, 0]
+        process = _ProcStub()
+
+        # When I wait for the proxy
+        _wait_for_proxy_ready(process, 5432, 10.0)  # type: ignore[arg-type]
+
+        # Then it should probe localhost and back off only once
+        mock_sock.connect_ex.assert_called_with(("127.0.0.1", 5432))
+        assert mock_sock.connect_ex.call_count == 2
+        mock_sleep.assert_called_once_with(0.05)
+
+    def test_raises_when_process_exits(self, socket_mocks: SimpleNamespace) -> None:
+        """Test that it fails fast when the proxy process exits."""
+        # Given a proxy process that has already exited
+        mock_sock = socket_mocks.sock
+        mock_sleep = socket_mocks.sleep
+        mock_sock.connect_ex.return_value = 111
+        process = _ProcStub(returncode=1)
+
+        # When I wait for the proxy
+        # Then it should raise RuntimeError without sleeping
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            _wait_for_proxy_ready(process, 5432, 10.0)  # type: ignore[arg-type]
+        mock_sleep.assert_not_called()
+
+    def test_raises_on_timeout(
+        self,
+        socket_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that it raises TimeoutError with exponential backoff."""
+        # Given a port that never accepts connections
+        mock_sock = socket_mocks.sock
+        mock_sleep = socket_mocks.sleep
+        mock_sock.connect_ex.return_value = 111
+        process = _ProcStub()
+        mock_monotonic = Mock(
+            side_effect=[0.0, 0.0, 0.05, 0.15, 0.35, 0.75, 1.25, 1.75, 2.0],
         )
+        monkeypatch.setattr(time, "monotonic", mock_monotonic)
+
+        # When I wait for the proxy with a 2 second timeout
+        # Then it should raise TimeoutError
+        with pytest.raises(TimeoutError, match="port 5432"):
+            _wait_for_proxy_ready(process, 5432, 2.0)  # type: ignore[arg-type]
+
+        # And the delay should double up to the 500ms cap, clamped to the deadline
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [
+            0.05,
+            0.1,
+            0.2,
+            0.4,
+            0.5,
+            0.5,
+            0.25,
+        ]
+
+
+@pytest.fixture
+def async_proxy_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch process startup and readiness for cloud_sql_proxy_running_async."""
+    create_subprocess_exec = AsyncMock()
+    wait_for_ready = AsyncMock()
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    monkeypatch.setattr(
+        cloud_sql_proxy,
+        "_wait_for_proxy_ready_async",
+        wait_for_ready,
+    )
+    return SimpleNamespace(
+        create_subprocess_exec=create_subprocess_exec,
+        wait_for_ready=wait_for_ready,
+    )
+
+
+class TestCloudSqlProxyRunningAsync:
+    """Tests for cloud_sql_proxy_running_async context manager."""
+
+    def test_starts_and_stops_proxy(
+        self,
+        async_proxy_mocks: SimpleNamespace,
+    ) -> None:
+        """Test that the async proxy starts and stops correctly."""
+        # Given a mock proxy process
+        mock_process = Mock(returncode=None, wait=AsyncMock(return_value=0))
+
+        async def run() -> None:
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stdout.feed_eof()
+            async_proxy_mocks.create_subprocess_exec.return_value = mock_process
+
+            # When I use the async context manager
+            async with cloud_sql_proxy_running_async(
+                instance_connection_name="project:region:instance",
+                port=5432,
+                cloud_sql_proxy_path="/usr/bin/cloud-sql-proxy",
+            ):
+                # Then the proxy should be started and awaited until ready
+                async_proxy_mocks.create_subprocess_exec.assert_awaited_once_with(
+                    "/usr/bin/cloud-sql-proxy",
+                    "project:region:instance",
+                    "--port",
+                    "5432",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    start_new_session=True,
+                )
+                async_proxy_mocks.wait_for_ready.assert_awaited_once_with(
+                    mock_process,
+                    5432,
+                    10.0,
+                )
+
+        asyncio.run(run())
+
+        # And the proxy should be terminated when exiting context
+        mock_process.terminate.assert_called_once()
+        mock_process.wait.assert_awaited_once()
+
+    def test_does_not_terminate_exited_proxy(
+        self,
+        async_proxy_mocks: SimpleNamespace,
+    ) -> None:
+        """Test that a proxy which already exited is not signalled again."""
+        # Given a proxy that exits before becoming ready
+        mock_process = Mock(
+            stdout=None,
+            returncode=1,
+            wait=AsyncMock(return_value=1),
+        )
+        async_proxy_mocks.create_subprocess_exec.return_value = mock_process
+        async_proxy_mocks.wait_for_ready.side_effect = RuntimeError("exited")
+
+        async def run() -> None:
+            async with cloud_sql_proxy_running_async(
+                instance_connection_name="project:region:instance",
+                port=5432,
+                cloud_sql_proxy_path="/usr/bin/cloud-sql-proxy",
+            ):
+                pass  # pragma: no cover
+
+        # When I enter the async context manager
+        # Then the readiness error should propagate
+        with pytest.raises(RuntimeError, match="exited"):
+            asyncio.run(run())
+
+        # And the exited process should only be reaped
+        mock_process.terminate.assert_not_called()
+        mock_process.wait.assert_awaited_once()
+
+
+class TestWaitForProxyReadyAsync:
+    """Tests for _wait_for_proxy_ready_async function."""
+
+    def test_returns_when_port_accepts_connections(self) -> None:
+        """Test that it returns once a server is listening on the port."""
+
+        async def run() -> None:
+            # Given a server listening on a local port
+            server = await asyncio.start_server(
+                lambda _reader, writer: writer.close(),
+                "127.0.0.1",
+                0,
+            )
+            port = server.sockets[0].getsockname()[1]
+            process = SimpleNamespace(returncode=None)
+
+            # When I wait for the proxy
+            # Then it should return without raising
+            async with server:
+                await _wait_for_proxy_ready_async(process, port, 5.0)  # type: ignore[arg-type]
+
+        asyncio.run(run())
+
+    def test_raises_when_process_exits(self) -> None:
+        """Test that it fails fast when the proxy process exits."""
+        # Given a closed port and a proxy process that has exited
+        port = _unused_port()
+        process = SimpleNamespace(returncode=1)
+
+        # When I wait for the proxy
+        # Then it should raise RuntimeError
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            asyncio.run(_wait_for_proxy_ready_async(process, port, 5.0))  # type: ignore[arg-type]
+
+    def test_raises_on_timeout(self) -> None:
+        """Test that it raises TimeoutError when the port never opens."""
+        # Given a closed port and a running proxy process
+        port = _unused_port()
+        process = SimpleNamespace(returncode=None)
+
+        # When I wait for the proxy with a short timeout
+        # Then it should raise TimeoutError
+        with pytest.raises(TimeoutError, match=f"port {port}"):
+            asyncio.run(_wait_for_proxy_ready_async(process, port, 0.1))  # type: ignore[arg-type]